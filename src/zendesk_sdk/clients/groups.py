@@ -86,7 +86,7 @@ class GroupsClient(BaseClient):
             print(f"Description: {group.description}")
         """
         response = await self._get(f"groups/{group_id}.json")
-        return Group(**response["group"])
+        return Group.model_validate(response["group"])
 
     def list(self, per_page: int = 100, limit: Optional[int] = None) -> "Paginator[Group]":
         """Get paginated list of all groups.
@@ -210,7 +210,7 @@ class GroupsClient(BaseClient):
             group_data["is_public"] = is_public
 
         response = await self._post("groups.json", json={"group": group_data})
-        return Group(**response["group"])
+        return Group.model_validate(response["group"])
 
     # ==================== Update Operations ====================
 
@@ -267,7 +267,7 @@ class GroupsClient(BaseClient):
             group_data["is_public"] = is_public
 
         response = await self._put(f"groups/{group_id}.json", json={"group": group_data})
-        return Group(**response["group"])
+        return Group.model_validate(response["group"])
 
     # ==================== Delete Operations ====================
 
@@ -364,4 +364,4 @@ class GroupsClient(BaseClient):
             print(f"User {membership.user_id} in Group {membership.group_id}")
         """
         response = await self._get(f"group_memberships/{membership_id}.json")
-        return GroupMembership(**response["group_membership"])
+        return GroupMembership.model_validate(response["group_membership"])
@@ -75,7 +75,7 @@ class ArticlesClient(HelpCenterBaseClient):
             Article object
         """
         response = await self._get(f"articles/{article_id}.json")
-        return Article(**response["article"])
+        return Article.model_validate(response["article"])
 
     def list(self, per_page: int = 100, limit: Optional[int] = None) -> "Paginator[Article]":
         """Get paginated list of all Help Center articles.
@@ -156,7 +156,7 @@ class ArticlesClient(HelpCenterBaseClient):
             params["label_names"] = ",".join(label_names)
 
         response = await self._get("articles/search.json", params=params)
-        return [Article(**article_data) for article_data in response.get("results", [])]
+        return [Article.model_validate(article_data) for article_data in response.get("results", [])]
 
     async def create(
         self,
@@ -204,7 +204,7 @@ class ArticlesClient(HelpCenterBaseClient):
             article_data["label_names"] = label_names
 
         response = await self._post(f"sections/{section_id}/articles.json", json={"article": article_data})
-        return Article(**response["article"])
+        return Article.model_validate(response["article"])
 
     async def update(
         self,
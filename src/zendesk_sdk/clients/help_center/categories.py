@@ -66,7 +66,7 @@ class CategoriesClient(HelpCenterBaseClient):
             Category object
         """
         response = await self._get(f"categories/{category_id}.json")
-        return Category(**response["category"])
+        return Category.model_validate(response["category"])
 
     def list(self, per_page: int = 100, limit: Optional[int] = None) -> "Paginator[Category]":
         """Get paginated list of Help Center categories.
@@ -104,7 +104,7 @@ class CategoriesClient(HelpCenterBaseClient):
             category_data["position"] = position
 
         response = await self._post("categories.json", json={"category": category_data})
-        return Category(**response["category"])
+        return Category.model_validate(response["category"])
 
     async def update(
         self,
@@ -70,7 +70,7 @@ class SectionsClient(HelpCenterBaseClient):
             Section object
         """
         response = await self._get(f"sections/{section_id}.json")
-        return Section(**response["section"])
+        return Section.model_validate(response["section"])
 
     def list(self, per_page: int = 100, limit: Optional[int] = None) -> "Paginator[Section]":
         """Get paginated list of all Help Center sections.
@@ -125,7 +125,7 @@ class SectionsClient(HelpCenterBaseClient):
             section_data["position"] = position
 
         response = await self._post(f"categories/{category_id}/sections.json", json={"section": section_data})
-        return Section(**response["section"])
+        return Section.model_validate(response["section"])
 
     async def update(
         self,
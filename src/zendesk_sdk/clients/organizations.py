@@ -79,7 +79,7 @@ class OrganizationsClient(BaseClient):
             print(f"Domains: {org.domain_names}")
         """
         response = await self._get(f"organizations/{org_id}.json")
-        return Organization(**response["organization"])
+        return Organization.model_validate(response["organization"])
 
     def list(self, per_page: int = 100, limit: Optional[int] = None) -> "Paginator[Organization]":
         """Get paginated list of all organizations.
@@ -186,7 +186,7 @@ class OrganizationsClient(BaseClient):
             org_data["organization_fields"] = organization_fields
 
         response = await self._post("organizations.json", json={"organization": org_data})
-        return Organization(**response["organization"])
+        return Organization.model_validate(response["organization"])
 
     async def create_or_update(
         self,
@@ -252,7 +252,7 @@ class OrganizationsClient(BaseClient):
             org_data["organization_fields"] = organization_fields
 
         response = await self._post("organizations/create_or_update.json", json={"organization": org_data})
-        return Organization(**response["organization"])
+        return Organization.model_validate(response["organization"])
 
     # ==================== Update Operations ====================
 
@@ -330,7 +330,7 @@ class OrganizationsClient(BaseClient):
             org_data["organization_fields"] = organization_fields
 
         response = await self._put(f"organizations/{org_id}.json", json={"organization": org_data})
-        return Organization(**response["organization"])
+        return Organization.model_validate(response["organization"])
 
     # ==================== Delete Operations ====================
 
@@ -59,7 +59,7 @@ class TicketFieldsClient(BaseClient):
             TicketField object
         """
         response = await self._get(f"ticket_fields/{field_id}.json")
-        return TicketField(**response["ticket_field"])
+        return TicketField.model_validate(response["ticket_field"])
 
     def list(self, per_page: int = 100, limit: Optional[int] = None) -> "Paginator[TicketField]":
         """Get paginated list of all ticket fields.
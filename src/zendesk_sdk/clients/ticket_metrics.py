@@ -54,7 +54,7 @@ class TicketMetricsClient(BaseClient):
             TicketMetrics object
         """
         response = await self._get(f"ticket_metrics/{metric_id}.json")
-        return TicketMetrics(**response["ticket_metric"])
+        return TicketMetrics.model_validate(response["ticket_metric"])
 
     async def for_ticket(self, ticket_id: int) -> TicketMetrics:
         """Get metrics for a given ticket.
@@ -69,7 +69,7 @@ class TicketMetricsClient(BaseClient):
             TicketMetrics object
         """
         response = await self._get(f"tickets/{ticket_id}/metrics.json")
-        return TicketMetrics(**response["ticket_metric"])
+        return TicketMetrics.model_validate(response["ticket_metric"])
 
     def list(self, per_page: int = 100, limit: Optional[int] = None) -> "Paginator[TicketMetrics]":
         """Get paginated list of all ticket metrics.
@@ -89,12 +89,12 @@ class CommentsClient(BaseClient):
         if not comments:
             return None
 
-        comment = Comment(**comments[0])
+        comment = Comment.model_validate(comments[0])
 
         author = None
         if comment.author_id:
             for user_data in response.get("users", []):
-                user = User(**user_data)
+                user = User.model_validate(user_data)
                 if user.id == comment.author_id:
                     author = user
                     break
@@ -146,7 +146,7 @@ class CommentsClient(BaseClient):
 
         payload = {"ticket": {"comment": comment_data}}
         response = await self._put(f"tickets/{ticket_id}.json", json=payload)
-        return Ticket(**response["ticket"])
+        return Ticket.model_validate(response["ticket"])
 
     async def make_private(self, ticket_id: int, comment_id: int) -> bool:
         """Make a public comment private (convert to internal note).
@@ -197,7 +197,7 @@ class CommentsClient(BaseClient):
             f"tickets/{ticket_id}/comments/{comment_id}/redact.json",
             json={"text": text},
         )
-        return Comment(**response["comment"])
+        return Comment.model_validate(response["comment"])
 
 
 class TagsClient(BaseClient):
@@ -375,7 +375,7 @@ class TicketsClient(BaseClient):
             print(f"Status: {ticket.status}")
         """
         response = await self._get(f"tickets/{ticket_id}.json")
-        return Ticket(**response["ticket"])
+        return Ticket.model_validate(response["ticket"])
 
     async def get_many(self, ticket_ids: List[int]) -> Dict[int, Ticket]:
         """Fetch multiple tickets by IDs.
@@ -398,7 +398,7 @@ class TicketsClient(BaseClient):
 
         tickets: Dict[int, Ticket] = {}
         for ticket_data in response.get("tickets", []):
-            ticket = Ticket(**ticket_data)
+            ticket = Ticket.model_validate(ticket_data)
             if ticket.id is not None:
                 tickets[ticket.id] = ticket
         return tickets
@@ -583,7 +583,7 @@ class TicketsClient(BaseClient):
             ticket_data["external_id"] = external_id
 
         response = await self._post("tickets.json", json={"ticket": ticket_data})
-        return Ticket(**response["ticket"])
+        return Ticket.model_validate(response["ticket"])
 
     async def update(
         self,
@@ -676,7 +676,7 @@ class TicketsClient(BaseClient):
             ticket_data["comment"] = comment
 
         response = await self._put(f"tickets/{ticket_id}.json", json={"ticket": ticket_data})
-        return Ticket(**response["ticket"])
+        return Ticket.model_validate(response["ticket"])
 
     async def delete(self, ticket_id: int) -> bool:
         """Delete a ticket.
@@ -710,7 +710,7 @@ class TicketsClient(BaseClient):
         """Extract sideloaded users from API response."""
         users: Dict[int, User] = {}
         for user_data in response.get("users", []):
-            user = User(**user_data)
+            user = User.model_validate(user_data)
             if user.id is not None:
                 users[user.id] = user
         return users
@@ -719,7 +719,7 @@ class TicketsClient(BaseClient):
         """Extract sideloaded organizations from API response."""
         organizations: Dict[int, Organization] = {}
         for org_data in response.get("organizations", []):
-            org = Organization(**org_data)
+            org = Organization.model_validate(org_data)
             if org.id is not None:
                 organizations[org.id] = org
         return organizations
@@ -748,31 +748,38 @@ class TicketsClient(BaseClient):
                 org_ids.add(ticket.organization_id)
         return list(org_ids)
 
+    async def _fetch_show_many(self, endpoint: str, response_key: str, ids: List[int]) -> Dict[str, Any]:
+        """Fetch records by IDs from a show_many endpoint.
+
+        IDs are deduplicated and split into chunks of 100 (the show_many limit),
+        which are requested concurrently. The records from every chunk are merged
+        into a single response-shaped dict under response_key; HTTP errors propagate.
+        """
+        unique_ids = list(dict.fromkeys(ids))
+        chunks = [unique_ids[i : i + 100] for i in range(0, len(unique_ids), 100)]
+        responses = await asyncio.gather(
+            *(self._get(f"{endpoint}?ids={','.join(str(record_id) for record_id in chunk)}") for chunk in chunks)
+        )
+        return {response_key: [record for response in responses for record in response.get(response_key, [])]}
+
     async def _fetch_users_batch(self, user_ids: List[int]) -> Dict[int, User]:
         """Fetch multiple users by IDs using show_many endpoint."""
         if not user_ids:
             return {}
 
-        unique_ids = list(set(user_ids))[:100]
-        ids_param = ",".join(str(uid) for uid in unique_ids)
-
-        response = await self._get(f"users/show_many.json?ids={ids_param}")
+        response = await self._fetch_show_many("users/show_many.json", "users", user_ids)
         return self._extract_users_from_response(response)
 
     async def _fetch_orgs_batch(self, org_ids: List[int]) -> Dict[int, Organization]:
         """Fetch multiple organizations by IDs using show_many endpoint.
 
-        Mirrors _fetch_users_batch: empty list -> {} with no request, dedup, max 100 per
-        request, HTTP errors propagate (not swallowed). A missing/deleted org simply does
-        not appear in the response, so the builder resolves it to None.
+        A missing/deleted org simply does not appear in the response, so the builder
+        resolves it to None.
         """
         if not org_ids:
             return {}
 
-        unique_ids = list(set(org_ids))[:100]
-        ids_param = ",".join(str(oid) for oid in unique_ids)
-
-        response = await self._get(f"organizations/show_many.json?ids={ids_param}")
+        response = await self._fetch_show_many("organizations/show_many.json", "organizations", org_ids)
         return self._extract_organizations_from_response(response)
 
     async def _fetch_comments_with_users(self, ticket_id: int) -> tuple[List[Comment], Dict[int, User]]:
@@ -781,7 +788,7 @@ class TicketsClient(BaseClient):
             f"tickets/{ticket_id}/comments.json",
             params={"include": "users", "include_inline_images": "true"},
         )
-        comments = [Comment(**c) for c in response.get("comments", [])]
+        comments = [Comment.model_validate(c) for c in response.get("comments", [])]
         users = self._extract_users_from_response(response)
         return comments, users
 
@@ -803,17 +810,16 @@ class TicketsClient(BaseClient):
             return None
         return organizations.get(org_id)
 
-    async def _build_enriched_ticket(
+    def _build_enriched_ticket(
         self,
         ticket: Ticket,
         ticket_users: Dict[int, User],
+        comments: List[Comment],
+        comment_users: Dict[int, User],
         fields: Optional[Dict[int, TicketField]] = None,
         organizations: Optional[Dict[int, Organization]] = None,
     ) -> EnrichedTicket:
-        """Build EnrichedTicket by fetching comments and merging users."""
-        if ticket.id is None:
-            raise ValueError("Ticket must have an ID to fetch full data")
-        comments, comment_users = await self._fetch_comments_with_users(ticket.id)
+        """Build EnrichedTicket from already fetched comments, merging ticket and comment users."""
         all_users = {**ticket_users, **comment_users}
         return EnrichedTicket(
             ticket=ticket,
@@ -915,15 +921,17 @@ class TicketsClient(BaseClient):
                 if field_def:
                     print(f"{field_def.title}: {custom_field.value}")
         """
-        # Fetch ticket with sideloaded users + organizations, and fields, in parallel
+        # Ticket (with sideloaded users + organizations), comments and fields only depend on
+        # the ticket ID, so all three are fetched in parallel
         ticket_task = self._get(f"tickets/{ticket_id}.json", params={"include": "users,organizations"})
+        comments_task = self._fetch_comments_with_users(ticket_id)
         fields_task = self._fetch_fields()
-        response, fields = await asyncio.gather(ticket_task, fields_task)
+        response, (comments, comment_users), fields = await asyncio.gather(ticket_task, comments_task, fields_task)
 
-        ticket = Ticket(**response["ticket"])
+        ticket = Ticket.model_validate(response["ticket"])
         ticket_users = self._extract_users_from_response(response)
         organizations = self._extract_organizations_from_response(response)
-        return await self._build_enriched_ticket(ticket, ticket_users, fields, organizations)
+        return self._build_enriched_ticket(ticket, ticket_users, comments, comment_users, fields, organizations)
 
     async def get_many_enriched(self, ticket_ids: List[int]) -> List[EnrichedTicket]:
         """Get multiple tickets with all related data: comments, users, organizations, and field definitions.
@@ -995,23 +1003,29 @@ class TicketsClient(BaseClient):
             self._http, query=full_query, per_page=100, limit=limit
         )
 
-        # Fetch fields once at the start
-        fields = await self._fetch_fields()
-
-        # Process in batches for efficient user fetching
-        batch: List[Ticket] = []
-        async for ticket in paginator:
-            batch.append(ticket)
-
-            if len(batch) >= 100:
+        # Fetch fields once, concurrently with the first search page
+        fields_task = asyncio.create_task(self._fetch_fields())
+        try:
+            # Process in batches for efficient user fetching
+            batch: List[Ticket] = []
+            async for ticket in paginator:
+                batch.append(ticket)
+
+                if len(batch) >= 100:
+                    async for enriched in self._enrich_ticket_batch(batch, await fields_task):
+                        yield enriched
+                    batch = []
+
+            # Process remaining; awaiting unconditionally surfaces a fields error on empty results too
+            fields = await fields_task
+            if batch:
                 async for enriched in self._enrich_ticket_batch(batch, fields):
                     yield enriched
-                batch = []
-
-        # Process remaining
-        if batch:
-            async for enriched in self._enrich_ticket_batch(batch, fields):
-                yield enriched
+        finally:
+            if not fields_task.done():
+                fields_task.cancel()
+            # Retrieve the task outcome so a failed fetch is never left unobserved
+            await asyncio.gather(fields_task, return_exceptions=True)
 
     async def _enrich_ticket_batch(
         self,
@@ -80,7 +80,7 @@ class UsersClient(BaseClient):
             User object
         """
         response = await self._get(f"users/{user_id}.json")
-        return User(**response["user"])
+        return User.model_validate(response["user"])
 
     def list(self, per_page: int = 100, limit: Optional[int] = None) -> "Paginator[User]":
         """Get paginated list of users.
@@ -108,7 +108,7 @@ class UsersClient(BaseClient):
         response = await self._get("users/search.json", params={"query": email})
         users = response.get("users", [])
         if users:
-            return User(**users[0])
+            return User.model_validate(users[0])
         return None
 
     async def get_many(self, user_ids: List[int]) -> Dict[int, User]:
@@ -132,7 +132,7 @@ class UsersClient(BaseClient):
 
         users: Dict[int, User] = {}
         for user_data in response.get("users", []):
-            user = User(**user_data)
+            user = User.model_validate(user_data)
             if user.id is not None:
                 users[user.id] = user
         return users
@@ -144,7 +144,7 @@ class UsersClient(BaseClient):
             User object for the authenticated user
         """
         response = await self._get("users/me.json")
-        return User(**response["user"])
+        return User.model_validate(response["user"])
 
     # ==================== Create Operations ====================
 
@@ -279,7 +279,7 @@ class UsersClient(BaseClient):
             user_data["identities"] = identities
 
         response = await self._post("users.json", json={"user": user_data})
-        return User(**response["user"])
+        return User.model_validate(response["user"])
 
     async def create_or_update(
         self,
@@ -355,7 +355,7 @@ class UsersClient(BaseClient):
             user_data["user_fields"] = user_fields
 
         response = await self._post("users/create_or_update.json", json={"user": user_data})
-        return User(**response["user"])
+        return User.model_validate(response["user"])
 
     async def create_many(self, users: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Create multiple users in a single request.
@@ -496,7 +496,7 @@ class UsersClient(BaseClient):
             user_data["user_fields"] = user_fields
 
         response = await self._put(f"users/{user_id}.json", json={"user": user_data})
-        return User(**response["user"])
+        return User.model_validate(response["user"])
 
     async def update_many(
         self,
@@ -664,7 +664,7 @@ class UsersClient(BaseClient):
             assert user.suspended is True
         """
         response = await self._put(f"users/{user_id}.json", json={"user": {"suspended": True}})
-        return User(**response["user"])
+        return User.model_validate(response["user"])
 
     async def unsuspend(self, user_id: int) -> User:
         """Unsuspend a previously suspended user.
@@ -682,7 +682,7 @@ class UsersClient(BaseClient):
             assert user.suspended is False
         """
         response = await self._put(f"users/{user_id}.json", json={"user": {"suspended": False}})
-        return User(**response["user"])
+        return User.model_validate(response["user"])
 
     # ==================== Merge Operations ====================
 
@@ -708,4 +708,4 @@ class UsersClient(BaseClient):
             )
         """
         response = await self._put(f"users/{user_id}/merge.json", json={"user": {"id": target_user_id}})
-        return User(**response["user"])
+        return User.model_validate(response["user"])
@@ -74,7 +74,7 @@ class ViewsClient(BaseClient):
             View object
         """
         response = await self._get(f"views/{view_id}.json")
-        return View(**response["view"])
+        return View.model_validate(response["view"])
 
     def list(
         self,
@@ -131,7 +131,7 @@ class ViewsClient(BaseClient):
 
         views: Dict[int, View] = {}
         for view_data in response.get("views", []):
-            view = View(**view_data)
+            view = View.model_validate(view_data)
             if view.id is not None:
                 views[view.id] = view
         return views
@@ -169,7 +169,7 @@ class ViewsClient(BaseClient):
             ViewCount with value, pretty representation, and freshness flag
         """
         response = await self._get(f"views/{view_id}/count.json")
-        return ViewCount(**response["view_count"])
+        return ViewCount.model_validate(response["view_count"])
 
     async def count_many(self, view_ids: List[int]) -> List[ViewCount]:
         """Get ticket counts for multiple views in a single request.
@@ -195,4 +195,4 @@ class ViewsClient(BaseClient):
         ids_param = ",".join(str(v) for v in unique_ids)
 
         response = await self._get(f"views/count_many.json?ids={ids_param}")
-        return [ViewCount(**c) for c in response.get("view_counts", [])]
+        return [ViewCount.model_validate(c) for c in response.get("view_counts", [])]
@@ -52,8 +52,9 @@ class HTTPClient:
         }
 
         auth: Optional[httpx.BasicAuth] = None
-        if self.config.auth_tuple:
-            auth = httpx.BasicAuth(username=self.config.auth_tuple[0], password=self.config.auth_tuple[1])
+        auth_tuple = self.config.auth_tuple
+        if auth_tuple:
+            auth = httpx.BasicAuth(username=auth_tuple[0], password=auth_tuple[1])
         elif self.config.oauth_token:
             headers["Authorization"] = f"Bearer {self.config.oauth_token}"
 
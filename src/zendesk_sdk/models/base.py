@@ -22,6 +22,8 @@ class ZendeskModel(BaseModel):
         str_to_lower=False,
         # Allow arbitrary types (for complex nested structures)
         arbitrary_types_allowed=True,
+        # Build each model's validator on first use instead of at import
+        defer_build=True,
     )
 
     @field_serializer("*", when_used="json")
@@ -46,5 +48,9 @@ class ZendeskModel(BaseModel):
         return f"{class_name}()"
 
     def __repr__(self) -> str:
-        """Detailed string representation."""
-        return f"{self.__class__.__name__}({self.model_dump()})"
+        """Detailed string representation.
+
+        Formats the field values directly rather than running the serializer;
+        nested models render through their own ``__repr__``.
+        """
+        return f"{self.__class__.__name__}({self.__dict__})"
@@ -2,7 +2,7 @@
 
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, AsyncIterator, Dict, Generic, List, Optional, TypeVar
+from typing import Any, AsyncIterator, Dict, Generic, List, Optional, Type, TypeVar
 
 from .exceptions import ZendeskPaginationException
 from .models import (
@@ -18,11 +18,13 @@ from .models import (
     TicketMetrics,
     User,
     View,
+    ZendeskModel,
 )
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
+M = TypeVar("M", bound=ZendeskModel)
 
 
 class PaginationInfo:
@@ -509,6 +511,14 @@ class ZendeskPaginator:
             print(ticket.subject)
     """
 
+    @staticmethod
+    def _search_results_of_type(results: List[Dict[str, Any]], result_type: str, model: Type[M]) -> List[M]:
+        """Validate the search results of a single result_type into models.
+
+        Results of any other type are skipped without being validated.
+        """
+        return [model.model_validate(r) for r in results if r.get("result_type") == result_type]
+
     @staticmethod
     def create_users_paginator(
         http_client: Any, per_page: int = 100, limit: Optional[int] = None
@@ -517,7 +527,7 @@ class ZendeskPaginator:
 
         class UsersPaginator(OffsetPaginator[User]):
             def _extract_items(self, response: Dict[str, Any]) -> List[User]:
-                return [User(**u) for u in response.get("users", [])]
+                return [User.model_validate(u) for u in response.get("users", [])]
 
         return UsersPaginator(http_client, "users.json", per_page=per_page, limit=limit)
 
@@ -529,7 +539,7 @@ class ZendeskPaginator:
 
         class TicketsPaginator(OffsetPaginator[Ticket]):
             def _extract_items(self, response: Dict[str, Any]) -> List[Ticket]:
-                return [Ticket(**t) for t in response.get("tickets", [])]
+                return [Ticket.model_validate(t) for t in response.get("tickets", [])]
 
         return TicketsPaginator(http_client, "tickets.json", per_page=per_page, limit=limit)
 
@@ -541,7 +551,7 @@ class ZendeskPaginator:
 
         class UserTicketsPaginator(OffsetPaginator[Ticket]):
             def _extract_items(self, response: Dict[str, Any]) -> List[Ticket]:
-                return [Ticket(**t) for t in response.get("tickets", [])]
+                return [Ticket.model_validate(t) for t in response.get("tickets", [])]
 
         return UserTicketsPaginator(
             http_client, f"users/{user_id}/tickets/requested.json", per_page=per_page, limit=limit
@@ -555,7 +565,7 @@ class ZendeskPaginator:
 
         class OrganizationTicketsPaginator(OffsetPaginator[Ticket]):
             def _extract_items(self, response: Dict[str, Any]) -> List[Ticket]:
-                return [Ticket(**t) for t in response.get("tickets", [])]
+                return [Ticket.model_validate(t) for t in response.get("tickets", [])]
 
         return OrganizationTicketsPaginator(
             http_client, f"organizations/{organization_id}/tickets.json", per_page=per_page, limit=limit
@@ -569,7 +579,7 @@ class ZendeskPaginator:
 
         class TicketCommentsPaginator(OffsetPaginator[Comment]):
             def _extract_items(self, response: Dict[str, Any]) -> List[Comment]:
-                return [Comment(**c) for c in response.get("comments", [])]
+                return [Comment.model_validate(c) for c in response.get("comments", [])]
 
         return TicketCommentsPaginator(
             http_client,
@@ -587,7 +597,7 @@ class ZendeskPaginator:
 
         class OrganizationsPaginator(OffsetPaginator[Organization]):
             def _extract_items(self, response: Dict[str, Any]) -> List[Organization]:
-                return [Organization(**o) for o in response.get("organizations", [])]
+                return [Organization.model_validate(o) for o in response.get("organizations", [])]
 
         return OrganizationsPaginator(http_client, "organizations.json", per_page=per_page, limit=limit)
 
@@ -599,7 +609,7 @@ class ZendeskPaginator:
 
         class GroupsPaginator(OffsetPaginator[Group]):
             def _extract_items(self, response: Dict[str, Any]) -> List[Group]:
-                return [Group(**g) for g in response.get("groups", [])]
+                return [Group.model_validate(g) for g in response.get("groups", [])]
 
         return GroupsPaginator(http_client, "groups.json", per_page=per_page, limit=limit)
 
@@ -611,7 +621,7 @@ class ZendeskPaginator:
 
         class AssignableGroupsPaginator(OffsetPaginator[Group]):
             def _extract_items(self, response: Dict[str, Any]) -> List[Group]:
-                return [Group(**g) for g in response.get("groups", [])]
+                return [Group.model_validate(g) for g in response.get("groups", [])]
 
         return AssignableGroupsPaginator(http_client, "groups/assignable.json", per_page=per_page, limit=limit)
 
@@ -623,7 +633,7 @@ class ZendeskPaginator:
 
         class GroupMembershipsPaginator(OffsetPaginator[GroupMembership]):
             def _extract_items(self, response: Dict[str, Any]) -> List[GroupMembership]:
-                return [GroupMembership(**m) for m in response.get("group_memberships", [])]
+                return [GroupMembership.model_validate(m) for m in response.get("group_memberships", [])]
 
         return GroupMembershipsPaginator(http_client, "group_memberships.json", per_page=per_page, limit=limit)
 
@@ -635,7 +645,7 @@ class ZendeskPaginator:
 
         class GroupMembershipsByGroupPaginator(OffsetPaginator[GroupMembership]):
             def _extract_items(self, response: Dict[str, Any]) -> List[GroupMembership]:
-                return [GroupMembership(**m) for m in response.get("group_memberships", [])]
+                return [GroupMembership.model_validate(m) for m in response.get("group_memberships", [])]
 
         return GroupMembershipsByGroupPaginator(
             http_client, f"groups/{group_id}/memberships.json", per_page=per_page, limit=limit
@@ -649,7 +659,7 @@ class ZendeskPaginator:
 
         class TicketFieldsPaginator(OffsetPaginator[TicketField]):
             def _extract_items(self, response: Dict[str, Any]) -> List[TicketField]:
-                return [TicketField(**f) for f in response.get("ticket_fields", [])]
+                return [TicketField.model_validate(f) for f in response.get("ticket_fields", [])]
 
         return TicketFieldsPaginator(http_client, "ticket_fields.json", per_page=per_page, limit=limit)
 
@@ -661,7 +671,7 @@ class ZendeskPaginator:
 
         class TicketMetricsPaginator(OffsetPaginator[TicketMetrics]):
             def _extract_items(self, response: Dict[str, Any]) -> List[TicketMetrics]:
-                return [TicketMetrics(**m) for m in response.get("ticket_metrics", [])]
+                return [TicketMetrics.model_validate(m) for m in response.get("ticket_metrics", [])]
 
         return TicketMetricsPaginator(http_client, "ticket_metrics.json", per_page=per_page, limit=limit)
 
@@ -683,7 +693,7 @@ class ZendeskPaginator:
 
         class ViewsPaginator(OffsetPaginator[View]):
             def _extract_items(self, response: Dict[str, Any]) -> List[View]:
-                return [View(**v) for v in response.get("views", [])]
+                return [View.model_validate(v) for v in response.get("views", [])]
 
         path = "views/active.json" if active_only else "views.json"
         return ViewsPaginator(http_client, path, per_page=per_page, limit=limit)
@@ -696,7 +706,7 @@ class ZendeskPaginator:
 
         class ViewTicketsPaginator(OffsetPaginator[Ticket]):
             def _extract_items(self, response: Dict[str, Any]) -> List[Ticket]:
-                return [Ticket(**t) for t in response.get("tickets", [])]
+                return [Ticket.model_validate(t) for t in response.get("tickets", [])]
 
         return ViewTicketsPaginator(http_client, f"views/{view_id}/tickets.json", per_page=per_page, limit=limit)
 
@@ -720,7 +730,7 @@ class ZendeskPaginator:
 
         class SearchTicketsPaginator(OffsetPaginator[Ticket]):
             def _extract_items(self, response: Dict[str, Any]) -> List[Ticket]:
-                return [Ticket(**r) for r in response.get("results", []) if r.get("result_type") == "ticket"]
+                return ZendeskPaginator._search_results_of_type(response.get("results", []), "ticket", Ticket)
 
         return SearchTicketsPaginator(
             http_client, "search.json", params={"query": query}, per_page=per_page, limit=limit
@@ -734,7 +744,7 @@ class ZendeskPaginator:
 
         class SearchUsersPaginator(OffsetPaginator[User]):
             def _extract_items(self, response: Dict[str, Any]) -> List[User]:
-                return [User(**r) for r in response.get("results", []) if r.get("result_type") == "user"]
+                return ZendeskPaginator._search_results_of_type(response.get("results", []), "user", User)
 
         return SearchUsersPaginator(http_client, "search.json", params={"query": query}, per_page=per_page, limit=limit)
 
@@ -746,9 +756,9 @@ class ZendeskPaginator:
 
         class SearchOrganizationsPaginator(OffsetPaginator[Organization]):
             def _extract_items(self, response: Dict[str, Any]) -> List[Organization]:
-                return [
-                    Organization(**r) for r in response.get("results", []) if r.get("result_type") == "organization"
-                ]
+                return ZendeskPaginator._search_results_of_type(
+                    response.get("results", []), "organization", Organization
+                )
 
         return SearchOrganizationsPaginator(
             http_client, "search.json", params={"query": query}, per_page=per_page, limit=limit
@@ -780,7 +790,7 @@ class ZendeskPaginator:
 
         class ExportTicketsPaginator(SearchExportPaginator):
             def _extract_items(self, response: Dict[str, Any]) -> List[Ticket]:
-                return [Ticket(**r) for r in response.get("results", [])]
+                return [Ticket.model_validate(r) for r in response.get("results", [])]
 
         return ExportTicketsPaginator(http_client, query, "ticket", page_size, limit=limit)
 
@@ -792,7 +802,7 @@ class ZendeskPaginator:
 
         class ExportUsersPaginator(SearchExportPaginator):
             def _extract_items(self, response: Dict[str, Any]) -> List[User]:
-                return [User(**r) for r in response.get("results", [])]
+                return [User.model_validate(r) for r in response.get("results", [])]
 
         return ExportUsersPaginator(http_client, query, "user", page_size, limit=limit)
 
@@ -804,7 +814,7 @@ class ZendeskPaginator:
 
         class ExportOrganizationsPaginator(SearchExportPaginator):
             def _extract_items(self, response: Dict[str, Any]) -> List[Organization]:
-                return [Organization(**r) for r in response.get("results", [])]
+                return [Organization.model_validate(r) for r in response.get("results", [])]
 
         return ExportOrganizationsPaginator(http_client, query, "organization", page_size, limit=limit)
 
@@ -832,7 +842,7 @@ class ZendeskPaginator:
 
         class CategoriesPaginator(OffsetPaginator[Category]):
             def _extract_items(self, response: Dict[str, Any]) -> List[Category]:
-                return [Category(**c) for c in response.get("categories", [])]
+                return [Category.model_validate(c) for c in response.get("categories", [])]
 
         return CategoriesPaginator(http_client, "help_center/categories.json", per_page=per_page, limit=limit)
 
@@ -851,7 +861,7 @@ class ZendeskPaginator:
 
         class SectionsPaginator(OffsetPaginator[Section]):
             def _extract_items(self, response: Dict[str, Any]) -> List[Section]:
-                return [Section(**s) for s in response.get("sections", [])]
+                return [Section.model_validate(s) for s in response.get("sections", [])]
 
         if category_id:
             path = f"help_center/categories/{category_id}/sections.json"
@@ -879,7 +889,7 @@ class ZendeskPaginator:
 
         class ArticlesPaginator(OffsetPaginator[Article]):
             def _extract_items(self, response: Dict[str, Any]) -> List[Article]:
-                return [Article(**a) for a in response.get("articles", [])]
+                return [Article.model_validate(a) for a in response.get("articles", [])]
 
         if section_id:
             path = f"help_center/sections/{section_id}/articles.json"
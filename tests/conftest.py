@@ -0,0 +1,26 @@
+"""Shared pytest fixtures."""
+
+from typing import AsyncIterator
+
+import pytest
+
+from zendesk_sdk.client import ZendeskClient
+from zendesk_sdk.config import ZendeskConfig
+
+
+@pytest.fixture(scope="session")
+def zendesk_config() -> ZendeskConfig:
+    """Validated test config, built once per session and shared read-only."""
+    return ZendeskConfig(
+        subdomain="test",
+        email="user@example.com",
+        token="abc123",
+    )
+
+
+@pytest.fixture
+async def client(zendesk_config: ZendeskConfig) -> AsyncIterator[ZendeskClient]:
+    """Fresh ZendeskClient per test, closed on teardown; it lazily holds HTTP state, so it is not shared."""
+    zendesk_client = ZendeskClient(zendesk_config)
+    yield zendesk_client
+    await zendesk_client.close()
@@ -0,0 +1,5 @@
+"""Shared test helpers."""
+
+# Stand-in HTTP client for objects that are only constructed and inspected, or whose
+# request helpers are all replaced by the test; any real use of it fails loudly
+UNUSED_HTTP_CLIENT = object()
@@ -1,28 +1,30 @@
 """Tests for ZendeskClient."""
 
-from unittest.mock import AsyncMock, patch
+from operator import attrgetter
+from unittest.mock import AsyncMock
 
 import pytest
 
-from zendesk_sdk.client import ZendeskClient
-from zendesk_sdk.config import ZendeskConfig
+from zendesk_sdk.clients import (
+    ArticlesClient,
+    AttachmentsClient,
+    CategoriesClient,
+    CommentsClient,
+    HelpCenterClient,
+    OrganizationsClient,
+    SearchClient,
+    SectionsClient,
+    TagsClient,
+    TicketsClient,
+    UsersClient,
+)
 
 
 class TestZendeskClient:
     """Test cases for ZendeskClient class."""
 
-    def get_client(self):
-        """Helper method to create a test client."""
-        config = ZendeskConfig(
-            subdomain="test",
-            email="user@example.com",
-            token="abc123",
-        )
-        return ZendeskClient(config)
-
-    def test_http_client_property(self):
+    def test_http_client_property(self, client):
         """Test HTTP client property creates client lazily."""
-        client = self.get_client()
         assert client._http_client is None
 
         # Access should create the client
@@ -35,173 +37,94 @@ class TestZendeskClient:
         assert http_client2 is http_client
 
     @pytest.mark.asyncio
-    async def test_close_method_no_http_client(self):
+    async def test_close_method_no_http_client(self, client):
         """Test close method when no HTTP client exists."""
-        client = self.get_client()
         # Don't access http_client property so it remains None
         await client.close()
 
     @pytest.mark.asyncio
-    async def test_context_manager_with_close(self):
+    async def test_context_manager_with_close(self, client):
         """Test context manager calls close on exit."""
-        client = self.get_client()
+        client.close = AsyncMock()
 
-        with patch.object(client, "close", new_callable=AsyncMock) as mock_close:
-            async with client as ctx_client:
-                assert ctx_client is client
+        async with client as ctx_client:
+            assert ctx_client is client
 
-            mock_close.assert_called_once()
+        client.close.assert_called_once()
 
-    def test_repr(self):
+    def test_repr(self, client):
         """Test __repr__ method."""
-        client = self.get_client()
         assert repr(client) == "ZendeskClient(subdomain='test')"
 
-    # Namespace access tests
-
-    def test_users_namespace(self):
-        """Test users namespace is accessible."""
-        client = self.get_client()
-        from zendesk_sdk.clients import UsersClient
-
-        assert isinstance(client.users, UsersClient)
-        # Should return same instance
-        assert client.users is client.users
-
-    def test_organizations_namespace(self):
-        """Test organizations namespace is accessible."""
-        client = self.get_client()
-        from zendesk_sdk.clients import OrganizationsClient
-
-        assert isinstance(client.organizations, OrganizationsClient)
-
-    def test_tickets_namespace(self):
-        """Test tickets namespace is accessible."""
-        client = self.get_client()
-        from zendesk_sdk.clients import TicketsClient
-
-        assert isinstance(client.tickets, TicketsClient)
-
-    def test_tickets_comments_namespace(self):
-        """Test tickets.comments namespace is accessible."""
-        client = self.get_client()
-        from zendesk_sdk.clients import CommentsClient
-
-        assert isinstance(client.tickets.comments, CommentsClient)
-
-    def test_tickets_tags_namespace(self):
-        """Test tickets.tags namespace is accessible."""
-        client = self.get_client()
-        from zendesk_sdk.clients import TagsClient
-
-        assert isinstance(client.tickets.tags, TagsClient)
-
-    def test_attachments_namespace(self):
-        """Test attachments namespace is accessible."""
-        client = self.get_client()
-        from zendesk_sdk.clients import AttachmentsClient
-
-        assert isinstance(client.attachments, AttachmentsClient)
-
-    def test_search_namespace(self):
-        """Test search namespace is accessible."""
-        client = self.get_client()
-        from zendesk_sdk.clients import SearchClient
-
-        assert isinstance(client.search, SearchClient)
-
-    def test_help_center_namespace(self):
-        """Test help_center namespace is accessible."""
-        client = self.get_client()
-        from zendesk_sdk.clients import HelpCenterClient
-
-        assert isinstance(client.help_center, HelpCenterClient)
-
-    def test_help_center_categories_namespace(self):
-        """Test help_center.categories namespace is accessible."""
-        client = self.get_client()
-        from zendesk_sdk.clients import CategoriesClient
-
-        assert isinstance(client.help_center.categories, CategoriesClient)
-
-    def test_help_center_sections_namespace(self):
-        """Test help_center.sections namespace is accessible."""
-        client = self.get_client()
-        from zendesk_sdk.clients import SectionsClient
-
-        assert isinstance(client.help_center.sections, SectionsClient)
-
-    def test_help_center_articles_namespace(self):
-        """Test help_center.articles namespace is accessible."""
-        client = self.get_client()
-        from zendesk_sdk.clients import ArticlesClient
-
-        assert isinstance(client.help_center.articles, ArticlesClient)
+    @pytest.mark.parametrize(
+        "namespace,client_cls",
+        [
+            ("users", UsersClient),
+            ("organizations", OrganizationsClient),
+            ("tickets", TicketsClient),
+            ("tickets.comments", CommentsClient),
+            ("tickets.tags", TagsClient),
+            ("attachments", AttachmentsClient),
+            ("search", SearchClient),
+            ("help_center", HelpCenterClient),
+            ("help_center.categories", CategoriesClient),
+            ("help_center.sections", SectionsClient),
+            ("help_center.articles", ArticlesClient),
+        ],
+    )
+    def test_namespace(self, client, namespace, client_cls):
+        """Test namespace is accessible and returns the same instance on each access."""
+        get_namespace = attrgetter(namespace)
+
+        assert isinstance(get_namespace(client), client_cls)
+        assert get_namespace(client) is get_namespace(client)
 
 
 class TestZendeskClientHTTPMethods:
     """Test cases for ZendeskClient low-level HTTP methods."""
 
-    def get_client(self):
-        """Helper method to create a test client."""
-        config = ZendeskConfig(
-            subdomain="test",
-            email="user@example.com",
-            token="abc123",
-        )
-        return ZendeskClient(config)
-
     @pytest.mark.asyncio
-    async def test_get_method(self):
+    async def test_get_method(self, client):
         """Test get method."""
-        client = self.get_client()
         mock_response = {"users": []}
 
-        with patch.object(client.http_client, "get", new_callable=AsyncMock) as mock_get:
-            mock_get.return_value = mock_response
+        client.http_client.get = AsyncMock(return_value=mock_response)
 
-            result = await client.get("users.json")
+        result = await client.get("users.json")
 
-            assert result == mock_response
-            mock_get.assert_called_once()
+        assert result == mock_response
+        client.http_client.get.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_post_method(self):
+    async def test_post_method(self, client):
         """Test post method."""
-        client = self.get_client()
         mock_response = {"user": {"id": 123, "name": "New User"}}
 
-        with patch.object(client.http_client, "post", new_callable=AsyncMock) as mock_post:
-            mock_post.return_value = mock_response
+        client.http_client.post = AsyncMock(return_value=mock_response)
 
-            result = await client.post("users.json", json={"user": {"name": "New User"}})
+        result = await client.post("users.json", json={"user": {"name": "New User"}})
 
-            assert result == mock_response
-            mock_post.assert_called_once()
+        assert result == mock_response
+        client.http_client.post.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_put_method(self):
+    async def test_put_method(self, client):
         """Test put method."""
-        client = self.get_client()
         mock_response = {"user": {"id": 123, "name": "Updated User"}}
 
-        with patch.object(client.http_client, "put", new_callable=AsyncMock) as mock_put:
-            mock_put.return_value = mock_response
+        client.http_client.put = AsyncMock(return_value=mock_response)
 
-            result = await client.put("users/123.json", json={"user": {"name": "Updated User"}})
+        result = await client.put("users/123.json", json={"user": {"name": "Updated User"}})
 
-            assert result == mock_response
-            mock_put.assert_called_once()
+        assert result == mock_response
+        client.http_client.put.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_delete_method(self):
+    async def test_delete_method(self, client):
         """Test delete method."""
-        client = self.get_client()
-
-        with patch.object(client.http_client, "delete", new_callable=AsyncMock) as mock_delete:
-            mock_delete.return_value = None
+        client.http_client.delete = AsyncMock(return_value=None)
 
-            result = await client.delete("users/123.json")
+        result = await client.delete("users/123.json")
 
-            assert result is None
-            mock_delete.assert_called_once()
+        assert result is None
+        client.http_client.delete.assert_called_once()
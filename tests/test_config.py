@@ -51,14 +51,20 @@ class TestZendeskConfig:
                 timeout=0.0,  # Must be > 0
             )
 
-    def test_invalid_max_retries(self):
-        """Test invalid max_retries values."""
+    @pytest.mark.parametrize(
+        "field_name,value",
+        [
+            ("max_retries", -1),  # Must be >= 0
+        ],
+    )
+    def test_invalid_field_value(self, field_name, value):
+        """Test out-of-range field values are rejected."""
         with pytest.raises(ValidationError):
             ZendeskConfig(
                 subdomain="test",
                 email="user@example.com",
                 token="api_token_123",
-                max_retries=-1,  # Must be >= 0
+                **{field_name: value},
             )
 
     def test_missing_all_auth(self):
@@ -1,9 +1,10 @@
 """Tests for Help Center clients."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock
 
 import pytest
 
+from tests.helpers import UNUSED_HTTP_CLIENT
 from zendesk_sdk.clients.help_center import (
     ArticlesClient,
     CategoriesClient,
@@ -17,9 +18,8 @@ class TestHelpCenterClient:
     """Test cases for HelpCenterClient namespace."""
 
     def get_client(self):
-        """Create a mock HelpCenterClient."""
-        mock_http = MagicMock()
-        return HelpCenterClient(mock_http)
+        """Create a HelpCenterClient with an unused HTTP client."""
+        return HelpCenterClient(UNUSED_HTTP_CLIENT)
 
     def test_categories_accessor(self):
         """Test categories accessor returns CategoriesClient."""
@@ -41,33 +41,8 @@ class TestCategoriesClient:
     """Test cases for CategoriesClient."""
 
     def get_client(self):
-        """Create a mock CategoriesClient."""
-        mock_http = MagicMock()
-        return CategoriesClient(mock_http)
-
-    @pytest.mark.asyncio
-    async def test_get(self):
-        """Test get category by ID."""
-        client = self.get_client()
-        category_data = {
-            "category": {
-                "id": 123,
-                "name": "Test Category",
-                "description": "Test description",
-                "position": 1,
-                "created_at": "2023-01-01T00:00:00Z",
-            }
-        }
-
-        with patch.object(client, "_get", new_callable=AsyncMock) as mock_get:
-            mock_get.return_value = category_data
-
-            result = await client.get(123)
-
-            assert isinstance(result, Category)
-            assert result.id == 123
-            assert result.name == "Test Category"
-            mock_get.assert_called_once_with("categories/123.json")
+        """Create a CategoriesClient with an unused HTTP client."""
+        return CategoriesClient(UNUSED_HTTP_CLIENT)
 
     @pytest.mark.asyncio
     async def test_create(self):
@@ -82,94 +57,21 @@ class TestCategoriesClient:
             }
         }
 
-        with patch.object(client, "_post", new_callable=AsyncMock) as mock_post:
-            mock_post.return_value = category_data
-
-            result = await client.create("New Category", description="New description")
-
-            assert isinstance(result, Category)
-            assert result.name == "New Category"
-            mock_post.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_update(self):
-        """Test update category."""
-        client = self.get_client()
-        category_data = {
-            "category": {
-                "id": 123,
-                "name": "Updated Category",
-                "source_locale": "en-us",
-                "created_at": "2023-01-01T00:00:00Z",
-            }
-        }
-
-        with (
-            patch.object(client, "_put", new_callable=AsyncMock) as mock_put,
-            patch.object(client, "_get", new_callable=AsyncMock) as mock_get,
-        ):
-            mock_get.return_value = category_data
-            mock_put.return_value = {}
-
-            result = await client.update(123, name="Updated Category")
+        client._post = AsyncMock(return_value=category_data)
 
-            assert isinstance(result, Category)
-            assert result.name == "Updated Category"
-            # Verify translation update was called
-            assert mock_put.call_count == 1
+        result = await client.create("New Category", description="New description")
 
-    @pytest.mark.asyncio
-    async def test_delete_without_force(self):
-        """Test delete category without force raises error."""
-        client = self.get_client()
-
-        with pytest.raises(ValueError, match="force=True"):
-            await client.delete(123)
-
-    @pytest.mark.asyncio
-    async def test_delete_with_force(self):
-        """Test delete category with force."""
-        client = self.get_client()
-
-        with patch.object(client, "_delete", new_callable=AsyncMock) as mock_delete:
-            mock_delete.return_value = None
-
-            result = await client.delete(123, force=True)
-
-            assert result is True
-            mock_delete.assert_called_once_with("categories/123.json")
+        assert isinstance(result, Category)
+        assert result.name == "New Category"
+        client._post.assert_called_once()
 
 
 class TestSectionsClient:
     """Test cases for SectionsClient."""
 
     def get_client(self):
-        """Create a mock SectionsClient."""
-        mock_http = MagicMock()
-        return SectionsClient(mock_http)
-
-    @pytest.mark.asyncio
-    async def test_get(self):
-        """Test get section by ID."""
-        client = self.get_client()
-        section_data = {
-            "section": {
-                "id": 456,
-                "name": "Test Section",
-                "category_id": 123,
-                "created_at": "2023-01-01T00:00:00Z",
-            }
-        }
-
-        with patch.object(client, "_get", new_callable=AsyncMock) as mock_get:
-            mock_get.return_value = section_data
-
-            result = await client.get(456)
-
-            assert isinstance(result, Section)
-            assert result.id == 456
-            assert result.category_id == 123
-            mock_get.assert_called_once_with("sections/456.json")
+        """Create a SectionsClient with an unused HTTP client."""
+        return SectionsClient(UNUSED_HTTP_CLIENT)
 
     @pytest.mark.asyncio
     async def test_create(self):
@@ -184,93 +86,20 @@ class TestSectionsClient:
             }
         }
 
-        with patch.object(client, "_post", new_callable=AsyncMock) as mock_post:
-            mock_post.return_value = section_data
-
-            result = await client.create(123, "New Section")
-
-            assert isinstance(result, Section)
-            mock_post.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_update(self):
-        """Test update section."""
-        client = self.get_client()
-        section_data = {
-            "section": {
-                "id": 456,
-                "name": "Updated Section",
-                "category_id": 123,
-                "source_locale": "en-us",
-                "created_at": "2023-01-01T00:00:00Z",
-            }
-        }
-
-        with (
-            patch.object(client, "_put", new_callable=AsyncMock) as mock_put,
-            patch.object(client, "_get", new_callable=AsyncMock) as mock_get,
-        ):
-            mock_get.return_value = section_data
-            mock_put.return_value = {}
+        client._post = AsyncMock(return_value=section_data)
 
-            result = await client.update(456, name="Updated Section")
+        result = await client.create(123, "New Section")
 
-            assert isinstance(result, Section)
-            assert result.name == "Updated Section"
-
-    @pytest.mark.asyncio
-    async def test_delete_without_force(self):
-        """Test delete section without force raises error."""
-        client = self.get_client()
-
-        with pytest.raises(ValueError, match="force=True"):
-            await client.delete(456)
-
-    @pytest.mark.asyncio
-    async def test_delete_with_force(self):
-        """Test delete section with force."""
-        client = self.get_client()
-
-        with patch.object(client, "_delete", new_callable=AsyncMock) as mock_delete:
-            mock_delete.return_value = None
-
-            result = await client.delete(456, force=True)
-
-            assert result is True
+        assert isinstance(result, Section)
+        client._post.assert_called_once()
 
 
 class TestArticlesClient:
     """Test cases for ArticlesClient."""
 
     def get_client(self):
-        """Create a mock ArticlesClient."""
-        mock_http = MagicMock()
-        return ArticlesClient(mock_http)
-
-    @pytest.mark.asyncio
-    async def test_get(self):
-        """Test get article by ID."""
-        client = self.get_client()
-        article_data = {
-            "article": {
-                "id": 789,
-                "title": "Test Article",
-                "body": "<p>Content</p>",
-                "section_id": 456,
-                "draft": False,
-                "created_at": "2023-01-01T00:00:00Z",
-            }
-        }
-
-        with patch.object(client, "_get", new_callable=AsyncMock) as mock_get:
-            mock_get.return_value = article_data
-
-            result = await client.get(789)
-
-            assert isinstance(result, Article)
-            assert result.id == 789
-            assert result.title == "Test Article"
-            mock_get.assert_called_once_with("articles/789.json")
+        """Create a ArticlesClient with an unused HTTP client."""
+        return ArticlesClient(UNUSED_HTTP_CLIENT)
 
     @pytest.mark.asyncio
     async def test_search(self):
@@ -288,15 +117,14 @@ class TestArticlesClient:
             ]
         }
 
-        with patch.object(client, "_get", new_callable=AsyncMock) as mock_get:
-            mock_get.return_value = search_data
+        client._get = AsyncMock(return_value=search_data)
 
-            result = await client.search("password")
+        result = await client.search("password")
 
-            assert len(result) == 1
-            assert isinstance(result[0], Article)
-            assert result[0].title == "Password Reset"
-            mock_get.assert_called_once_with("articles/search.json", params={"query": "password", "per_page": 25})
+        assert len(result) == 1
+        assert isinstance(result[0], Article)
+        assert result[0].title == "Password Reset"
+        client._get.assert_called_once_with("articles/search.json", params={"query": "password", "per_page": 25})
 
     @pytest.mark.asyncio
     async def test_create(self):
@@ -313,14 +141,13 @@ class TestArticlesClient:
             }
         }
 
-        with patch.object(client, "_post", new_callable=AsyncMock) as mock_post:
-            mock_post.return_value = article_data
+        client._post = AsyncMock(return_value=article_data)
 
-            result = await client.create(456, "New Article", body="<p>Content</p>")
+        result = await client.create(456, "New Article", body="<p>Content</p>")
 
-            assert isinstance(result, Article)
-            assert result.draft is True
-            mock_post.assert_called_once()
+        assert isinstance(result, Article)
+        assert result.draft is True
+        client._post.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_create_published(self):
@@ -336,48 +163,114 @@ class TestArticlesClient:
             }
         }
 
-        with patch.object(client, "_post", new_callable=AsyncMock) as mock_post:
-            mock_post.return_value = article_data
+        client._post = AsyncMock(return_value=article_data)
+
+        result = await client.create(456, "Published Article", draft=False)
+
+        assert result.draft is False
+
+
+_HELP_CENTER_RESOURCES = [
+    pytest.param(
+        CategoriesClient,
+        Category,
+        "category",
+        "categories/123.json",
+        {
+            "id": 123,
+            "name": "Test Category",
+            "description": "Test description",
+            "position": 1,
+            "created_at": "2023-01-01T00:00:00Z",
+        },
+        {"name": "Updated Category"},
+        {"force": True},
+        id="category",
+    ),
+    pytest.param(
+        SectionsClient,
+        Section,
+        "section",
+        "sections/456.json",
+        {
+            "id": 456,
+            "name": "Test Section",
+            "category_id": 123,
+            "created_at": "2023-01-01T00:00:00Z",
+        },
+        {"name": "Updated Section"},
+        {"force": True},
+        id="section",
+    ),
+    pytest.param(
+        ArticlesClient,
+        Article,
+        "article",
+        "articles/789.json",
+        {
+            "id": 789,
+            "title": "Test Article",
+            "body": "<p>Content</p>",
+            "section_id": 456,
+            "draft": False,
+            "created_at": "2023-01-01T00:00:00Z",
+        },
+        {"title": "Updated Article"},
+        {},
+        id="article",
+    ),
+]
+
+
+@pytest.mark.parametrize("client_cls,model,key,path,data,changes,delete_kwargs", _HELP_CENTER_RESOURCES)
+class TestHelpCenterResourceCRUD:
+    """Get/update/delete test cases shared by categories, sections and articles."""
+
+    @pytest.mark.asyncio
+    async def test_get(self, client_cls, model, key, path, data, changes, delete_kwargs):
+        """Test get resource by ID."""
+        client = client_cls(UNUSED_HTTP_CLIENT)
+
+        client._get = AsyncMock(return_value={key: data})
 
-            result = await client.create(456, "Published Article", draft=False)
+        result = await client.get(data["id"])
 
-            assert result.draft is False
+        assert result == model.model_validate(data)
+        client._get.assert_called_once_with(path)
 
     @pytest.mark.asyncio
-    async def test_update(self):
-        """Test update article."""
-        client = self.get_client()
-        article_data = {
-            "article": {
-                "id": 789,
-                "title": "Updated Article",
-                "section_id": 456,
-                "source_locale": "en-us",
-                "created_at": "2023-01-01T00:00:00Z",
-            }
-        }
+    async def test_update(self, client_cls, model, key, path, data, changes, delete_kwargs):
+        """Test update resource."""
+        client = client_cls(UNUSED_HTTP_CLIENT)
+        updated = {**data, **changes, "source_locale": "en-us"}
 
-        with (
-            patch.object(client, "_put", new_callable=AsyncMock) as mock_put,
-            patch.object(client, "_get", new_callable=AsyncMock) as mock_get,
-        ):
-            mock_get.return_value = article_data
-            mock_put.return_value = {}
+        client._put = AsyncMock(return_value={})
+        client._get = AsyncMock(return_value={key: updated})
 
-            result = await client.update(789, title="Updated Article")
+        result = await client.update(data["id"], **changes)
 
-            assert isinstance(result, Article)
-            assert result.title == "Updated Article"
+        assert result == model.model_validate(updated)
+        # Verify translation update was called
+        assert client._put.call_count == 1
 
     @pytest.mark.asyncio
-    async def test_delete(self):
-        """Test delete article."""
-        client = self.get_client()
+    async def test_delete(self, client_cls, model, key, path, data, changes, delete_kwargs):
+        """Test delete resource (categories and sections require force)."""
+        client = client_cls(UNUSED_HTTP_CLIENT)
+
+        client._delete = AsyncMock(return_value=None)
+
+        result = await client.delete(data["id"], **delete_kwargs)
+
+        assert result is True
+        client._delete.assert_called_once_with(path)
 
-        with patch.object(client, "_delete", new_callable=AsyncMock) as mock_delete:
-            mock_delete.return_value = None
 
-            result = await client.delete(789)
+@pytest.mark.parametrize("client_cls", [CategoriesClient, SectionsClient])
+@pytest.mark.asyncio
+async def test_delete_without_force(client_cls):
+    """Test deleting a category or section without force raises error."""
+    client = client_cls(UNUSED_HTTP_CLIENT)
 
-            assert result is True
-            mock_delete.assert_called_once_with("articles/789.json")
+    with pytest.raises(ValueError, match="force=True"):
+        await client.delete(123)
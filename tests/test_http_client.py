@@ -1,10 +1,12 @@
 """Tests for HTTP client."""
 
+import asyncio
 from unittest.mock import AsyncMock, Mock, patch
 
 import httpx
 import pytest
 
+from zendesk_sdk import http_client as http_client_module
 from zendesk_sdk.config import ZendeskConfig
 from zendesk_sdk.exceptions import (
     ZendeskHTTPException,
@@ -13,19 +15,20 @@ from zendesk_sdk.exceptions import (
 )
 from zendesk_sdk.http_client import HTTPClient
 
+_REQUEST = httpx.Request("GET", "https://test.zendesk.com/api/v2/users.json")
 
-def _make_success_response(rate_limit_remaining: int | None = None) -> Mock:
-    """Create a mock successful response with optional rate limit header."""
-    response = Mock()
-    response.status_code = 200
-    response.is_success = True
-    response.json.return_value = {"result": "ok"}
-    response.content = b'{"result": "ok"}'
+
+def _make_response(status_code: int, json: dict, headers: dict | None = None) -> httpx.Response:
+    """Create a real httpx response bound to a placeholder request."""
+    return httpx.Response(status_code, json=json, headers=headers, request=_REQUEST)
+
+
+def _make_success_response(rate_limit_remaining: int | None = None) -> httpx.Response:
+    """Create a successful response with optional rate limit header."""
     headers = {}
     if rate_limit_remaining is not None:
         headers["X-Rate-Limit-Remaining"] = str(rate_limit_remaining)
-    response.headers = headers
-    return response
+    return _make_response(200, {"result": "ok"}, headers)
 
 
 class TestHTTPClient:
@@ -96,17 +99,14 @@ class TestHTTPClient:
         http_client = HTTPClient(config)
 
         # Mock rate limited response
-        rate_limit_response = Mock()
-        rate_limit_response.status_code = 429
-        rate_limit_response.headers = {"retry-after": "60"}
-        rate_limit_response.json.return_value = {"description": "Rate limit exceeded"}
+        rate_limit_response = _make_response(429, {"description": "Rate limit exceeded"}, {"retry-after": "60"})
 
         # Mock the _client attribute directly and return it from client property
-        mock_httpx_client = AsyncMock()
+        mock_httpx_client = AsyncMock(spec=httpx.AsyncClient)
         http_client._client = mock_httpx_client
         with patch.object(http_client, "_client", mock_httpx_client) as mock_client:
             mock_client.request = AsyncMock(return_value=rate_limit_response)
-            with patch("asyncio.sleep", new_callable=AsyncMock):
+            with patch.object(asyncio, "sleep", new_callable=AsyncMock):
 
                 with pytest.raises(ZendeskRateLimitException) as exc_info:
                     await http_client.get("users.json")
@@ -122,11 +122,11 @@ class TestHTTPClient:
         http_client = HTTPClient(config)
 
         # Mock the _client attribute directly and return it from client property
-        mock_httpx_client = AsyncMock()
+        mock_httpx_client = AsyncMock(spec=httpx.AsyncClient)
         http_client._client = mock_httpx_client
         with patch.object(http_client, "_client", mock_httpx_client) as mock_client:
             mock_client.request = AsyncMock(side_effect=httpx.TimeoutException("Request timed out"))
-            with patch("asyncio.sleep", new_callable=AsyncMock):
+            with patch.object(asyncio, "sleep", new_callable=AsyncMock):
 
                 with pytest.raises(ZendeskTimeoutException) as exc_info:
                     await http_client.get("users.json")
@@ -141,13 +141,10 @@ class TestHTTPClient:
         http_client = HTTPClient(config)
 
         # Mock 404 response
-        error_response = Mock()
-        error_response.status_code = 404
-        error_response.is_success = False
-        error_response.json.return_value = {"error": "Not found"}
+        error_response = _make_response(404, {"error": "Not found"})
 
         # Mock the _client attribute directly and return it from client property
-        mock_httpx_client = AsyncMock()
+        mock_httpx_client = AsyncMock(spec=httpx.AsyncClient)
         http_client._client = mock_httpx_client
         with patch.object(http_client, "_client", mock_httpx_client) as mock_client:
             mock_client.request = AsyncMock(return_value=error_response)
@@ -166,7 +163,7 @@ class TestHTTPClient:
         http_client = HTTPClient(config)
 
         # Create a mock client
-        mock_httpx_client = AsyncMock()
+        mock_httpx_client = AsyncMock(spec=httpx.AsyncClient)
         http_client._client = mock_httpx_client
 
         await http_client.close()
@@ -196,17 +193,14 @@ class TestHTTPClient:
         http_client = HTTPClient(config)
 
         # Mock server error
-        server_error_response = Mock()
-        server_error_response.status_code = 500
-        server_error_response.is_success = False
-        server_error_response.json.return_value = {"error": "Server error"}
+        server_error_response = _make_response(500, {"error": "Server error"})
 
         # Mock the _client attribute directly and return it from client property
-        mock_httpx_client = AsyncMock()
+        mock_httpx_client = AsyncMock(spec=httpx.AsyncClient)
         http_client._client = mock_httpx_client
         with patch.object(http_client, "_client", mock_httpx_client) as mock_client:
             mock_client.request = AsyncMock(return_value=server_error_response)
-            with patch("asyncio.sleep", new_callable=AsyncMock):
+            with patch.object(asyncio, "sleep", new_callable=AsyncMock):
 
                 with pytest.raises(ZendeskHTTPException):
                     # Override max_retries to 1 (instead of config's 3)
@@ -227,11 +221,11 @@ class TestProactiveRateLimiting:
 
         response = _make_success_response(rate_limit_remaining=30)
 
-        mock_httpx_client = AsyncMock()
+        mock_httpx_client = AsyncMock(spec=httpx.AsyncClient)
         http_client._client = mock_httpx_client
         with patch.object(http_client, "_client", mock_httpx_client) as mock_client:
             mock_client.request = AsyncMock(return_value=response)
-            with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            with patch.object(asyncio, "sleep", new_callable=AsyncMock) as mock_sleep:
                 await http_client.get("users.json")
                 mock_sleep.assert_not_called()
 
@@ -243,13 +237,13 @@ class TestProactiveRateLimiting:
 
         response = _make_success_response(rate_limit_remaining=100)
 
-        mock_httpx_client = AsyncMock()
+        mock_httpx_client = AsyncMock(spec=httpx.AsyncClient)
         http_client._client = mock_httpx_client
         with patch.object(http_client, "_client", mock_httpx_client) as mock_client:
             mock_client.request = AsyncMock(return_value=response)
-            with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            with patch.object(asyncio, "sleep", new_callable=AsyncMock) as mock_sleep:
                 # Flow: _update_state(t=100) → _apply_proactive(t=102) → _update_state(t=102)
-                with patch("zendesk_sdk.http_client.monotonic", side_effect=[100.0, 102.0, 102.0]):
+                with patch.object(http_client_module, "monotonic", side_effect=[100.0, 102.0, 102.0]):
                     # First request — sets state
                     await http_client.get("users.json")
                     # Second request — remaining (100) >= threshold (50), no sleep
@@ -270,13 +264,13 @@ class TestProactiveRateLimiting:
 
         response = _make_success_response(rate_limit_remaining=30)
 
-        mock_httpx_client = AsyncMock()
+        mock_httpx_client = AsyncMock(spec=httpx.AsyncClient)
         http_client._client = mock_httpx_client
         with patch.object(http_client, "_client", mock_httpx_client) as mock_client:
             mock_client.request = AsyncMock(return_value=response)
-            with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            with patch.object(asyncio, "sleep", new_callable=AsyncMock) as mock_sleep:
                 # Flow: _update_state(t=100) → _apply_proactive(t=103) → _update_state(t=103)
-                with patch("zendesk_sdk.http_client.monotonic", side_effect=[100.0, 103.0, 103.0]):
+                with patch.object(http_client_module, "monotonic", side_effect=[100.0, 103.0, 103.0]):
                     await http_client.get("users.json")
                     await http_client.get("users.json")
 
@@ -299,13 +293,13 @@ class TestProactiveRateLimiting:
 
         response = _make_success_response(rate_limit_remaining=30)
 
-        mock_httpx_client = AsyncMock()
+        mock_httpx_client = AsyncMock(spec=httpx.AsyncClient)
         http_client._client = mock_httpx_client
         with patch.object(http_client, "_client", mock_httpx_client) as mock_client:
             mock_client.request = AsyncMock(return_value=response)
-            with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            with patch.object(asyncio, "sleep", new_callable=AsyncMock) as mock_sleep:
                 # Flow: _update_state(t=100) → _apply_proactive(t=115) → _update_state(t=115)
-                with patch("zendesk_sdk.http_client.monotonic", side_effect=[100.0, 115.0, 115.0]):
+                with patch.object(http_client_module, "monotonic", side_effect=[100.0, 115.0, 115.0]):
                     await http_client.get("users.json")
                     await http_client.get("users.json")
                     mock_sleep.assert_not_called()
@@ -318,11 +312,11 @@ class TestProactiveRateLimiting:
 
         response = _make_success_response(rate_limit_remaining=75)
 
-        mock_httpx_client = AsyncMock()
+        mock_httpx_client = AsyncMock(spec=httpx.AsyncClient)
         http_client._client = mock_httpx_client
         with patch.object(http_client, "_client", mock_httpx_client) as mock_client:
             mock_client.request = AsyncMock(return_value=response)
-            with patch("zendesk_sdk.http_client.monotonic", return_value=100.0):
+            with patch.object(http_client_module, "monotonic", return_value=100.0):
                 await http_client.get("users.json")
 
         assert http_client._last_limit_remaining == 75
@@ -336,7 +330,7 @@ class TestProactiveRateLimiting:
 
         response = _make_success_response(rate_limit_remaining=30)
 
-        mock_httpx_client = AsyncMock()
+        mock_httpx_client = AsyncMock(spec=httpx.AsyncClient)
         http_client._client = mock_httpx_client
         with patch.object(http_client, "_client", mock_httpx_client) as mock_client:
             mock_client.request = AsyncMock(return_value=response)
@@ -354,12 +348,12 @@ class TestProactiveRateLimiting:
         response_with_header = _make_success_response(rate_limit_remaining=75)
         response_without_header = _make_success_response(rate_limit_remaining=None)
 
-        mock_httpx_client = AsyncMock()
+        mock_httpx_client = AsyncMock(spec=httpx.AsyncClient)
         http_client._client = mock_httpx_client
         with patch.object(http_client, "_client", mock_httpx_client) as mock_client:
             mock_client.request = AsyncMock(side_effect=[response_with_header, response_without_header])
             # Flow: _update_state(t=100) → _apply_proactive(t=105) → _update_state(t=105)
-            with patch("zendesk_sdk.http_client.monotonic", side_effect=[100.0, 105.0, 105.0]):
+            with patch.object(http_client_module, "monotonic", side_effect=[100.0, 105.0, 105.0]):
                 await http_client.get("users.json")
                 assert http_client._last_limit_remaining == 75
 
@@ -11,6 +11,7 @@ from zendesk_sdk.models import (
     CommentAttachment,
     CommentMetadata,
     CommentVia,
+    EnrichedTicket,
     Organization,
     OrganizationField,
     OrganizationSubscription,
@@ -64,6 +65,7 @@ class TestZendeskModel:
         assert config["use_enum_values"] is True
         assert config["validate_assignment"] is True
         assert config["extra"] == "ignore"
+        assert config["defer_build"] is True
 
     def test_extra_fields_ignored(self):
         """Test that extra fields are ignored."""
@@ -478,14 +480,19 @@ class TestZendeskModelStrRepr:
         assert "123" in result
         assert "Test User" in result
 
+    def test_repr_nested_model(self):
+        """Test __repr__ shows nested models by their own repr."""
+        ticket = Ticket(id=456, via={"channel": "web"})
+        result = repr(ticket)
+        assert result.startswith("Ticket({")
+        assert "'via': TicketVia({'channel': 'web', 'source': None})" in result
+
 
 class TestEnrichedTicketModel:
     """Test EnrichedTicket model."""
 
     def test_enriched_ticket_creation(self):
         """Test EnrichedTicket creation."""
-        from zendesk_sdk.models import EnrichedTicket
-
         ticket = Ticket(id=789, subject="Test Ticket", requester_id=123, assignee_id=456)
         comments = [Comment(id=111, body="Comment 1", author_id=123)]
         users = {
@@ -501,8 +508,6 @@ class TestEnrichedTicketModel:
 
     def test_enriched_ticket_organization_default_none(self):
         """organization defaults to None when not provided."""
-        from zendesk_sdk.models import EnrichedTicket
-
         ticket = Ticket(id=789, subject="Test", requester_id=123)
         enriched = EnrichedTicket(ticket=ticket)
 
@@ -510,8 +515,6 @@ class TestEnrichedTicketModel:
 
     def test_enriched_ticket_with_organization(self):
         """organization is stored when provided."""
-        from zendesk_sdk.models import EnrichedTicket
-
         ticket = Ticket(id=789, subject="Test", requester_id=123, organization_id=42)
         org = Organization(id=42, name="Acme Inc")
         enriched = EnrichedTicket(ticket=ticket, organization=org)
@@ -522,8 +525,6 @@ class TestEnrichedTicketModel:
 
     def test_enriched_ticket_get_user(self):
         """Test get_user method."""
-        from zendesk_sdk.models import EnrichedTicket
-
         ticket = Ticket(id=789, subject="Test", requester_id=123)
         users = {123: User(id=123, name="Requester")}
 
@@ -544,8 +545,6 @@ class TestEnrichedTicketModel:
 
     def test_enriched_ticket_requester_property(self):
         """Test requester property."""
-        from zendesk_sdk.models import EnrichedTicket
-
         ticket = Ticket(id=789, subject="Test", requester_id=123)
         users = {123: User(id=123, name="Requester")}
 
@@ -556,8 +555,6 @@ class TestEnrichedTicketModel:
 
     def test_enriched_ticket_requester_property_none(self):
         """Test requester property when no requester_id."""
-        from zendesk_sdk.models import EnrichedTicket
-
         ticket = Ticket(id=789, subject="Test")
         enriched = EnrichedTicket(ticket=ticket)
 
@@ -565,8 +562,6 @@ class TestEnrichedTicketModel:
 
     def test_enriched_ticket_assignee_property(self):
         """Test assignee property."""
-        from zendesk_sdk.models import EnrichedTicket
-
         ticket = Ticket(id=789, subject="Test", assignee_id=456)
         users = {456: User(id=456, name="Assignee")}
 
@@ -577,8 +572,6 @@ class TestEnrichedTicketModel:
 
     def test_enriched_ticket_assignee_property_none(self):
         """Test assignee property when no assignee_id."""
-        from zendesk_sdk.models import EnrichedTicket
-
         ticket = Ticket(id=789, subject="Test")
         enriched = EnrichedTicket(ticket=ticket)
 
@@ -586,8 +579,6 @@ class TestEnrichedTicketModel:
 
     def test_enriched_ticket_submitter_property(self):
         """Test submitter property."""
-        from zendesk_sdk.models import EnrichedTicket
-
         ticket = Ticket(id=789, subject="Test", submitter_id=789)
         users = {789: User(id=789, name="Submitter")}
 
@@ -598,8 +589,6 @@ class TestEnrichedTicketModel:
 
     def test_enriched_ticket_get_comment_author(self):
         """Test get_comment_author method."""
-        from zendesk_sdk.models import EnrichedTicket
-
         ticket = Ticket(id=789, subject="Test")
         comment = Comment(id=111, body="Comment", author_id=123)
         users = {123: User(id=123, name="Author")}
@@ -612,8 +601,6 @@ class TestEnrichedTicketModel:
 
     def test_enriched_ticket_get_comment_author_not_found(self):
         """Test get_comment_author when author not in users."""
-        from zendesk_sdk.models import EnrichedTicket
-
         ticket = Ticket(id=789, subject="Test")
         comment = Comment(id=111, body="Comment", author_id=999)
 
@@ -624,8 +611,6 @@ class TestEnrichedTicketModel:
 
     def test_enriched_ticket_get_field(self):
         """Test get_field method."""
-        from zendesk_sdk.models import EnrichedTicket, TicketField
-
         ticket = Ticket(id=789, subject="Test")
         fields = {
             123: TicketField(id=123, type="text", title="Custom Field"),
@@ -646,9 +631,6 @@ class TestEnrichedTicketModel:
 
     def test_enriched_ticket_get_field_value(self):
         """Test get_field_value method."""
-        from zendesk_sdk.models import EnrichedTicket
-        from zendesk_sdk.models.ticket import TicketCustomField
-
         ticket = Ticket(
             id=789,
             subject="Test",
@@ -673,8 +655,6 @@ class TestEnrichedTicketModel:
 
     def test_enriched_ticket_get_field_value_no_custom_fields(self):
         """Test get_field_value when ticket has no custom fields."""
-        from zendesk_sdk.models import EnrichedTicket
-
         ticket = Ticket(id=789, subject="Test")
         enriched = EnrichedTicket(ticket=ticket)
 
@@ -683,9 +663,6 @@ class TestEnrichedTicketModel:
 
     def test_enriched_ticket_get_field_values(self):
         """Test get_field_values method."""
-        from zendesk_sdk.models import EnrichedTicket, TicketField
-        from zendesk_sdk.models.ticket import TicketCustomField
-
         ticket = Ticket(
             id=789,
             subject="Test",
@@ -713,9 +690,6 @@ class TestEnrichedTicketModel:
 
     def test_enriched_ticket_get_field_values_missing_definition(self):
         """Test get_field_values when field definition is missing."""
-        from zendesk_sdk.models import EnrichedTicket, TicketField
-        from zendesk_sdk.models.ticket import TicketCustomField
-
         ticket = Ticket(
             id=789,
             subject="Test",
@@ -741,8 +715,6 @@ class TestEnrichedTicketModel:
 
     def test_enriched_ticket_get_field_values_empty(self):
         """Test get_field_values when ticket has no custom fields."""
-        from zendesk_sdk.models import EnrichedTicket
-
         ticket = Ticket(id=789, subject="Test")
         enriched = EnrichedTicket(ticket=ticket)
 
@@ -1,10 +1,12 @@
 """Tests for pagination functionality."""
 
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import AsyncMock
 
 import pytest
 
+from tests.helpers import UNUSED_HTTP_CLIENT
 from zendesk_sdk.exceptions import ZendeskPaginationException
+from zendesk_sdk.models import Organization, Ticket, User
 from zendesk_sdk.pagination import (
     CursorPaginator,
     OffsetPaginator,
@@ -84,10 +86,9 @@ class TestOffsetPaginator:
 
     def test_init(self):
         """Test OffsetPaginator initialization."""
-        http_client = Mock()
-        paginator = OffsetPaginator(http_client, "users.json", params={"sort": "name"}, per_page=50)
+        paginator = OffsetPaginator(UNUSED_HTTP_CLIENT, "users.json", params={"sort": "name"}, per_page=50)
 
-        assert paginator.http_client == http_client
+        assert paginator.http_client is UNUSED_HTTP_CLIENT
         assert paginator.path == "users.json"
         assert paginator.params == {"sort": "name"}
         assert paginator.per_page == 50
@@ -96,8 +97,7 @@ class TestOffsetPaginator:
 
     def test_get_page_params(self):
         """Test offset-based page parameters generation."""
-        http_client = Mock()
-        paginator = OffsetPaginator(http_client, "users.json", per_page=25)
+        paginator = OffsetPaginator(UNUSED_HTTP_CLIENT, "users.json", per_page=25)
         paginator._current_page = 3
 
         params = paginator._get_page_params()
@@ -105,8 +105,7 @@ class TestOffsetPaginator:
 
     def test_build_page_params(self):
         """Test building complete page parameters."""
-        http_client = Mock()
-        paginator = OffsetPaginator(http_client, "users.json", params={"sort": "name"}, per_page=50)
+        paginator = OffsetPaginator(UNUSED_HTTP_CLIENT, "users.json", params={"sort": "name"}, per_page=50)
         paginator._current_page = 2
 
         params = paginator._build_page_params()
@@ -115,8 +114,7 @@ class TestOffsetPaginator:
 
     def test_extract_items_default(self):
         """Test default item extraction."""
-        http_client = Mock()
-        paginator = OffsetPaginator(http_client, "test.json")
+        paginator = OffsetPaginator(UNUSED_HTTP_CLIENT, "test.json")
 
         response = {"items": [{"id": 1}, {"id": 2}]}
         items = paginator._extract_items(response)
@@ -124,8 +122,7 @@ class TestOffsetPaginator:
 
     def test_extract_items_empty(self):
         """Test item extraction with empty response."""
-        http_client = Mock()
-        paginator = OffsetPaginator(http_client, "test.json")
+        paginator = OffsetPaginator(UNUSED_HTTP_CLIENT, "test.json")
 
         response = {}
         items = paginator._extract_items(response)
@@ -133,8 +130,7 @@ class TestOffsetPaginator:
 
     def test_update_pagination_state(self):
         """Test pagination state update."""
-        http_client = Mock()
-        paginator = OffsetPaginator(http_client, "users.json")
+        paginator = OffsetPaginator(UNUSED_HTTP_CLIENT, "users.json")
 
         response = {"page": 1, "per_page": 100, "count": 250, "has_more": True}
         has_more = paginator._update_pagination_state(response)
@@ -145,8 +141,7 @@ class TestOffsetPaginator:
 
     def test_has_more_pages_with_has_more_field(self):
         """Test has_more_pages with explicit has_more field."""
-        http_client = Mock()
-        paginator = OffsetPaginator(http_client, "users.json")
+        paginator = OffsetPaginator(UNUSED_HTTP_CLIENT, "users.json")
         paginator._pagination_info = PaginationInfo(has_more=True)
 
         assert paginator._has_more_pages() is True
@@ -156,8 +151,7 @@ class TestOffsetPaginator:
 
     def test_has_more_pages_with_count(self):
         """Test has_more_pages calculation using count."""
-        http_client = Mock()
-        paginator = OffsetPaginator(http_client, "users.json", per_page=100)
+        paginator = OffsetPaginator(UNUSED_HTTP_CLIENT, "users.json", per_page=100)
         paginator._current_page = 2
         paginator._pagination_info = PaginationInfo(count=250)
 
@@ -169,8 +163,7 @@ class TestOffsetPaginator:
 
     def test_has_more_pages_fallback(self):
         """Test has_more_pages fallback behavior."""
-        http_client = Mock()
-        paginator = OffsetPaginator(http_client, "users.json")
+        paginator = OffsetPaginator(UNUSED_HTTP_CLIENT, "users.json")
         paginator._pagination_info = PaginationInfo()
 
         # Should return True as fallback
@@ -178,15 +171,13 @@ class TestOffsetPaginator:
 
     def test_has_more_pages_no_pagination_info(self):
         """Test has_more_pages with no pagination info."""
-        http_client = Mock()
-        paginator = OffsetPaginator(http_client, "users.json")
+        paginator = OffsetPaginator(UNUSED_HTTP_CLIENT, "users.json")
 
         assert paginator._has_more_pages() is False
 
     def test_advance_to_next_page(self):
         """Test advancing to next page."""
-        http_client = Mock()
-        paginator = OffsetPaginator(http_client, "users.json")
+        paginator = OffsetPaginator(UNUSED_HTTP_CLIENT, "users.json")
 
         assert paginator._current_page == 1
         paginator._advance_to_next_page()
@@ -265,10 +256,9 @@ class TestCursorPaginator:
 
     def test_init(self):
         """Test CursorPaginator initialization."""
-        http_client = Mock()
-        paginator = CursorPaginator(http_client, "incremental/tickets.json", params={"start_time": 1234567890})
+        paginator = CursorPaginator(UNUSED_HTTP_CLIENT, "incremental/tickets.json", params={"start_time": 1234567890})
 
-        assert paginator.http_client == http_client
+        assert paginator.http_client is UNUSED_HTTP_CLIENT
         assert paginator.path == "incremental/tickets.json"
         assert paginator.params == {"start_time": 1234567890}
         assert paginator._next_cursor is None
@@ -276,16 +266,14 @@ class TestCursorPaginator:
 
     def test_get_page_params_initial(self):
         """Test cursor-based page parameters for initial request."""
-        http_client = Mock()
-        paginator = CursorPaginator(http_client, "incremental/tickets.json", per_page=50)
+        paginator = CursorPaginator(UNUSED_HTTP_CLIENT, "incremental/tickets.json", per_page=50)
 
         params = paginator._get_page_params()
         assert params == {"per_page": 50}
 
     def test_get_page_params_with_cursor(self):
         """Test cursor-based page parameters with cursor."""
-        http_client = Mock()
-        paginator = CursorPaginator(http_client, "incremental/tickets.json", per_page=50)
+        paginator = CursorPaginator(UNUSED_HTTP_CLIENT, "incremental/tickets.json", per_page=50)
         paginator._next_cursor = "abc123"
         paginator._has_started = True
 
@@ -294,8 +282,7 @@ class TestCursorPaginator:
 
     def test_extract_items_default(self):
         """Test default item extraction for cursor paginator."""
-        http_client = Mock()
-        paginator = CursorPaginator(http_client, "test.json")
+        paginator = CursorPaginator(UNUSED_HTTP_CLIENT, "test.json")
 
         response = {"items": [{"id": 1}, {"id": 2}]}
         items = paginator._extract_items(response)
@@ -303,8 +290,7 @@ class TestCursorPaginator:
 
     def test_update_pagination_state_with_next_cursor(self):
         """Test pagination state update with next cursor."""
-        http_client = Mock()
-        paginator = CursorPaginator(http_client, "incremental/tickets.json")
+        paginator = CursorPaginator(UNUSED_HTTP_CLIENT, "incremental/tickets.json")
 
         response = {
             "next_cursor": "xyz789",
@@ -319,8 +305,7 @@ class TestCursorPaginator:
 
     def test_update_pagination_state_with_after_cursor(self):
         """Test pagination state update with after_cursor field."""
-        http_client = Mock()
-        paginator = CursorPaginator(http_client, "incremental/tickets.json")
+        paginator = CursorPaginator(UNUSED_HTTP_CLIENT, "incremental/tickets.json")
 
         response = {
             "after_cursor": "abc123",
@@ -333,8 +318,7 @@ class TestCursorPaginator:
 
     def test_update_pagination_state_with_links(self):
         """Test pagination state update with links field."""
-        http_client = Mock()
-        paginator = CursorPaginator(http_client, "incremental/tickets.json")
+        paginator = CursorPaginator(UNUSED_HTTP_CLIENT, "incremental/tickets.json")
 
         response = {
             "links": {"next": "https://test.zendesk.com/api/v2/tickets.json?cursor=def456"},
@@ -347,15 +331,13 @@ class TestCursorPaginator:
 
     def test_has_more_pages_not_started(self):
         """Test has_more_pages when not started."""
-        http_client = Mock()
-        paginator = CursorPaginator(http_client, "incremental/tickets.json")
+        paginator = CursorPaginator(UNUSED_HTTP_CLIENT, "incremental/tickets.json")
 
         assert paginator._has_more_pages() is True
 
     def test_has_more_pages_with_has_more_field(self):
         """Test has_more_pages with explicit has_more field."""
-        http_client = Mock()
-        paginator = CursorPaginator(http_client, "incremental/tickets.json")
+        paginator = CursorPaginator(UNUSED_HTTP_CLIENT, "incremental/tickets.json")
         paginator._has_started = True
         paginator._pagination_info = PaginationInfo(has_more=False)
 
@@ -363,8 +345,7 @@ class TestCursorPaginator:
 
     def test_has_more_pages_with_cursor(self):
         """Test has_more_pages based on cursor presence."""
-        http_client = Mock()
-        paginator = CursorPaginator(http_client, "incremental/tickets.json")
+        paginator = CursorPaginator(UNUSED_HTTP_CLIENT, "incremental/tickets.json")
         paginator._has_started = True
         paginator._next_cursor = "abc123"
 
@@ -375,8 +356,7 @@ class TestCursorPaginator:
 
     def test_advance_to_next_page(self):
         """Test advance to next page (no-op for cursor paginator)."""
-        http_client = Mock()
-        paginator = CursorPaginator(http_client, "incremental/tickets.json")
+        paginator = CursorPaginator(UNUSED_HTTP_CLIENT, "incremental/tickets.json")
 
         # Should be a no-op since cursor advancement is handled in _update_pagination_state
         paginator._advance_to_next_page()
@@ -410,10 +390,7 @@ class TestZendeskPaginator:
 
     def test_create_users_paginator(self):
         """Test creating users paginator."""
-        from zendesk_sdk.models import User
-
-        http_client = Mock()
-        paginator = ZendeskPaginator.create_users_paginator(http_client, per_page=50)
+        paginator = ZendeskPaginator.create_users_paginator(UNUSED_HTTP_CLIENT, per_page=50)
 
         assert isinstance(paginator, OffsetPaginator)
         assert paginator.path == "users.json"
@@ -431,10 +408,7 @@ class TestZendeskPaginator:
 
     def test_create_tickets_paginator(self):
         """Test creating tickets paginator."""
-        from zendesk_sdk.models import Ticket
-
-        http_client = Mock()
-        paginator = ZendeskPaginator.create_tickets_paginator(http_client, per_page=25)
+        paginator = ZendeskPaginator.create_tickets_paginator(UNUSED_HTTP_CLIENT, per_page=25)
 
         assert isinstance(paginator, OffsetPaginator)
         assert paginator.path == "tickets.json"
@@ -450,10 +424,7 @@ class TestZendeskPaginator:
 
     def test_create_organizations_paginator(self):
         """Test creating organizations paginator."""
-        from zendesk_sdk.models import Organization
-
-        http_client = Mock()
-        paginator = ZendeskPaginator.create_organizations_paginator(http_client, per_page=75)
+        paginator = ZendeskPaginator.create_organizations_paginator(UNUSED_HTTP_CLIENT, per_page=75)
 
         assert isinstance(paginator, OffsetPaginator)
         assert paginator.path == "organizations.json"
@@ -469,9 +440,8 @@ class TestZendeskPaginator:
 
     def test_create_search_paginator(self):
         """Test creating search paginator."""
-        http_client = Mock()
         query = "type:user status:active"
-        paginator = ZendeskPaginator.create_search_paginator(http_client, query, per_page=30)
+        paginator = ZendeskPaginator.create_search_paginator(UNUSED_HTTP_CLIENT, query, per_page=30)
 
         assert isinstance(paginator, OffsetPaginator)
         assert paginator.path == "search.json"
@@ -483,11 +453,61 @@ class TestZendeskPaginator:
         items = paginator._extract_items(response)
         assert items == [{"id": 1, "result_type": "user"}, {"id": 2, "result_type": "ticket"}]
 
+    def test_search_results_of_type(self):
+        """Only results of the requested result_type are validated into models."""
+        results = [
+            {"id": 1, "result_type": "user", "name": "User 1"},
+            {"id": 2, "result_type": "ticket", "subject": "Ticket 2"},
+            {"id": 3, "result_type": "organization", "name": "Org 3"},
+            {"id": 4, "result_type": "group", "name": "Group 4"},
+            {"id": 5, "result_type": "ticket", "subject": "Ticket 5"},
+            {"id": 6, "name": "No type"},
+        ]
+
+        tickets = ZendeskPaginator._search_results_of_type(results, "ticket", Ticket)
+        users = ZendeskPaginator._search_results_of_type(results, "user", User)
+        orgs = ZendeskPaginator._search_results_of_type(results, "organization", Organization)
+
+        assert [t.id for t in tickets] == [2, 5]
+        assert all(isinstance(t, Ticket) for t in tickets)
+        assert [u.id for u in users] == [1]
+        assert isinstance(users[0], User)
+        assert [o.id for o in orgs] == [3]
+        assert isinstance(orgs[0], Organization)
+
+    def test_search_results_of_type_skips_malformed_results_of_other_types(self):
+        """A malformed result of another type does not break extraction."""
+        results = [
+            {"id": 1, "result_type": "ticket", "subject": "Ticket 1"},
+            {"id": "not-an-id", "result_type": "user"},
+        ]
+
+        tickets = ZendeskPaginator._search_results_of_type(results, "ticket", Ticket)
+
+        assert [t.id for t in tickets] == [1]
+
+    def test_typed_search_paginators_filter_by_result_type(self):
+        """Typed search paginators keep only results of their own type."""
+        response = {
+            "results": [
+                {"id": 1, "result_type": "user", "name": "User 1"},
+                {"id": 2, "result_type": "ticket", "subject": "Ticket 2"},
+                {"id": 3, "result_type": "organization", "name": "Org 3"},
+            ]
+        }
+
+        tickets = ZendeskPaginator.create_search_tickets_paginator(UNUSED_HTTP_CLIENT, "q")._extract_items(response)
+        users = ZendeskPaginator.create_search_users_paginator(UNUSED_HTTP_CLIENT, "q")._extract_items(response)
+        orgs = ZendeskPaginator.create_search_organizations_paginator(UNUSED_HTTP_CLIENT, "q")._extract_items(response)
+
+        assert [t.id for t in tickets] == [2]
+        assert [u.id for u in users] == [1]
+        assert [o.id for o in orgs] == [3]
+
     def test_create_incremental_paginator(self):
         """Test creating incremental export paginator."""
-        http_client = Mock()
         start_time = 1234567890
-        paginator = ZendeskPaginator.create_incremental_paginator(http_client, "tickets", start_time)
+        paginator = ZendeskPaginator.create_incremental_paginator(UNUSED_HTTP_CLIENT, "tickets", start_time)
 
         assert isinstance(paginator, CursorPaginator)
         assert paginator.path == "incremental/tickets.json"
@@ -500,8 +520,7 @@ class TestZendeskPaginator:
 
     def test_create_ticket_comments_paginator_includes_inline_images(self):
         """Ticket comments paginator requests inline images by default."""
-        http_client = Mock()
-        paginator = ZendeskPaginator.create_ticket_comments_paginator(http_client, 123)
+        paginator = ZendeskPaginator.create_ticket_comments_paginator(UNUSED_HTTP_CLIENT, 123)
 
         assert isinstance(paginator, OffsetPaginator)
         assert paginator.path == "tickets/123/comments.json"
@@ -519,8 +538,7 @@ class TestTotalCountAndCount:
 
     def test_total_count_before_fetch_returns_none(self):
         """total_count is None before any page is fetched."""
-        http_client = Mock()
-        paginator = OffsetPaginator(http_client, "users.json")
+        paginator = OffsetPaginator(UNUSED_HTTP_CLIENT, "users.json")
         assert paginator.total_count is None
 
     @pytest.mark.asyncio
@@ -616,8 +634,7 @@ class TestTotalCountAndCount:
 
     def test_total_count_cursor_paginator_is_none(self):
         """total_count on cursor paginator is None before and stays None after fetch."""
-        http_client = Mock()
-        paginator = CursorPaginator(http_client, "incremental/tickets.json")
+        paginator = CursorPaginator(UNUSED_HTTP_CLIENT, "incremental/tickets.json")
         assert paginator.total_count is None
 
         # simulate after-fetch state without count field
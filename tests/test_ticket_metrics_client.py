@@ -1,9 +1,10 @@
 """Tests for TicketMetricsClient."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock
 
 import pytest
 
+from tests.helpers import UNUSED_HTTP_CLIENT
 from zendesk_sdk.clients import TicketMetricsClient
 from zendesk_sdk.models import TicketMetrics
 from zendesk_sdk.pagination import OffsetPaginator, ZendeskPaginator
@@ -13,8 +14,8 @@ class TestTicketMetricsClient:
     """Test cases for TicketMetricsClient."""
 
     def get_client(self) -> TicketMetricsClient:
-        """Create a TicketMetricsClient with a mock HTTP client."""
-        return TicketMetricsClient(MagicMock())
+        """Create a TicketMetricsClient with an unused HTTP client."""
+        return TicketMetricsClient(UNUSED_HTTP_CLIENT)
 
     @pytest.mark.asyncio
     async def test_get(self) -> None:
@@ -28,16 +29,15 @@ class TestTicketMetricsClient:
             }
         }
 
-        with patch.object(client, "_get", new_callable=AsyncMock) as mock_get:
-            mock_get.return_value = payload
+        client._get = AsyncMock(return_value=payload)
 
-            result = await client.get(999)
+        result = await client.get(999)
 
-            assert isinstance(result, TicketMetrics)
-            assert result.id == 999
-            assert result.ticket_id == 42
-            assert result.reply_time_in_minutes == {"calendar": 42, "business": 15}
-            mock_get.assert_called_once_with("ticket_metrics/999.json")
+        assert isinstance(result, TicketMetrics)
+        assert result.id == 999
+        assert result.ticket_id == 42
+        assert result.reply_time_in_minutes == {"calendar": 42, "business": 15}
+        client._get.assert_called_once_with("ticket_metrics/999.json")
 
     @pytest.mark.asyncio
     async def test_for_ticket(self) -> None:
@@ -51,15 +51,14 @@ class TestTicketMetricsClient:
             }
         }
 
-        with patch.object(client, "_get", new_callable=AsyncMock) as mock_get:
-            mock_get.return_value = payload
+        client._get = AsyncMock(return_value=payload)
 
-            result = await client.for_ticket(42)
+        result = await client.for_ticket(42)
 
-            assert isinstance(result, TicketMetrics)
-            assert result.ticket_id == 42
-            assert result.full_resolution_time_in_minutes == {"calendar": 1440, "business": 480}
-            mock_get.assert_called_once_with("tickets/42/metrics.json")
+        assert isinstance(result, TicketMetrics)
+        assert result.ticket_id == 42
+        assert result.full_resolution_time_in_minutes == {"calendar": 1440, "business": 480}
+        client._get.assert_called_once_with("tickets/42/metrics.json")
 
     def test_list_returns_paginator(self) -> None:
         """list() returns an OffsetPaginator over TicketMetrics."""
@@ -1,10 +1,12 @@
 """Tests for ViewsClient."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock
 
 import pytest
 
+from tests.helpers import UNUSED_HTTP_CLIENT
 from zendesk_sdk.clients import ViewsClient
+from zendesk_sdk.config import CacheConfig
 from zendesk_sdk.models import Ticket, View, ViewCount
 from zendesk_sdk.pagination import OffsetPaginator, ZendeskPaginator
 
@@ -13,8 +15,8 @@ class TestViewsClient:
     """Test cases for ViewsClient."""
 
     def get_client(self) -> ViewsClient:
-        """Create a ViewsClient with a mock HTTP client (no cache)."""
-        return ViewsClient(MagicMock())
+        """Create a ViewsClient with an unused HTTP client (no cache)."""
+        return ViewsClient(UNUSED_HTTP_CLIENT)
 
     @pytest.mark.asyncio
     async def test_get(self) -> None:
@@ -33,17 +35,16 @@ class TestViewsClient:
             }
         }
 
-        with patch.object(client, "_get", new_callable=AsyncMock) as mock_get:
-            mock_get.return_value = payload
+        client._get = AsyncMock(return_value=payload)
 
-            result = await client.get(12345)
+        result = await client.get(12345)
 
-            assert isinstance(result, View)
-            assert result.id == 12345
-            assert result.title == "My Open Tickets"
-            assert result.active is True
-            assert result.conditions == {"all": [{"field": "status", "operator": "less_than", "value": "solved"}]}
-            mock_get.assert_called_once_with("views/12345.json")
+        assert isinstance(result, View)
+        assert result.id == 12345
+        assert result.title == "My Open Tickets"
+        assert result.active is True
+        assert result.conditions == {"all": [{"field": "status", "operator": "less_than", "value": "solved"}]}
+        client._get.assert_called_once_with("views/12345.json")
 
     def test_list_returns_paginator(self) -> None:
         """list() returns an OffsetPaginator over Views."""
@@ -95,27 +96,27 @@ class TestViewsClient:
             ]
         }
 
-        with patch.object(client, "_get", new_callable=AsyncMock) as mock_get:
-            mock_get.return_value = payload
+        client._get = AsyncMock(return_value=payload)
 
-            result = await client.get_many([1, 2, 1])
+        result = await client.get_many([1, 2, 1])
 
-            assert set(result.keys()) == {1, 2}
-            assert result[1].title == "First"
-            # The query string contains both ids in some order
-            called_path = mock_get.call_args.args[0]
-            assert called_path.startswith("views/show_many.json?ids=")
-            ids_in_path = sorted(called_path.split("ids=")[1].split(","))
-            assert ids_in_path == ["1", "2"]
+        assert set(result.keys()) == {1, 2}
+        assert result[1].title == "First"
+        # The query string contains both ids in some order
+        called_path = client._get.call_args.args[0]
+        assert called_path.startswith("views/show_many.json?ids=")
+        ids_in_path = sorted(called_path.split("ids=")[1].split(","))
+        assert ids_in_path == ["1", "2"]
 
     @pytest.mark.asyncio
     async def test_get_many_empty_returns_empty(self) -> None:
         """get_many([]) short-circuits — no HTTP call."""
         client = self.get_client()
-        with patch.object(client, "_get", new_callable=AsyncMock) as mock_get:
-            result = await client.get_many([])
-            assert result == {}
-            mock_get.assert_not_called()
+        client._get = AsyncMock()
+
+        result = await client.get_many([])
+        assert result == {}
+        client._get.assert_not_called()
 
     def test_tickets_returns_paginator(self) -> None:
         """tickets(view_id) returns paginator pointed at the right path."""
@@ -162,16 +163,15 @@ class TestViewsClient:
             }
         }
 
-        with patch.object(client, "_get", new_callable=AsyncMock) as mock_get:
-            mock_get.return_value = payload
+        client._get = AsyncMock(return_value=payload)
 
-            result = await client.count(12345)
+        result = await client.count(12345)
 
-            assert isinstance(result, ViewCount)
-            assert result.view_id == 12345
-            assert result.value == 42
-            assert result.fresh is True
-            mock_get.assert_called_once_with("views/12345/count.json")
+        assert isinstance(result, ViewCount)
+        assert result.view_id == 12345
+        assert result.value == 42
+        assert result.fresh is True
+        client._get.assert_called_once_with("views/12345/count.json")
 
     @pytest.mark.asyncio
     async def test_count_many(self) -> None:
@@ -184,25 +184,25 @@ class TestViewsClient:
             ]
         }
 
-        with patch.object(client, "_get", new_callable=AsyncMock) as mock_get:
-            mock_get.return_value = payload
+        client._get = AsyncMock(return_value=payload)
 
-            result = await client.count_many([1, 2])
+        result = await client.count_many([1, 2])
 
-            assert len(result) == 2
-            assert all(isinstance(c, ViewCount) for c in result)
-            assert {c.view_id for c in result} == {1, 2}
-            called_path = mock_get.call_args.args[0]
-            assert called_path.startswith("views/count_many.json?ids=")
+        assert len(result) == 2
+        assert all(isinstance(c, ViewCount) for c in result)
+        assert {c.view_id for c in result} == {1, 2}
+        called_path = client._get.call_args.args[0]
+        assert called_path.startswith("views/count_many.json?ids=")
 
     @pytest.mark.asyncio
     async def test_count_many_empty(self) -> None:
         """count_many([]) short-circuits."""
         client = self.get_client()
-        with patch.object(client, "_get", new_callable=AsyncMock) as mock_get:
-            result = await client.count_many([])
-            assert result == []
-            mock_get.assert_not_called()
+        client._get = AsyncMock()
+
+        result = await client.count_many([])
+        assert result == []
+        client._get.assert_not_called()
 
     def test_no_write_methods(self) -> None:
         """Read-only client must not expose create/update/delete."""
@@ -235,14 +235,10 @@ class TestViewsClientCaching:
     """Cache wiring smoke test — get() should be cached when CacheConfig enables it."""
 
     def test_get_is_cached_method(self) -> None:
-        from zendesk_sdk.config import CacheConfig
-
-        client = ViewsClient(MagicMock(), cache_config=CacheConfig(enabled=True))
+        client = ViewsClient(UNUSED_HTTP_CLIENT, cache_config=CacheConfig(enabled=True))
         # When caching is enabled, get is wrapped by alru_cache and exposes cache_info.
         assert hasattr(client.get, "cache_info")
 
     def test_get_not_cached_when_disabled(self) -> None:
-        from zendesk_sdk.config import CacheConfig
-
-        client = ViewsClient(MagicMock(), cache_config=CacheConfig(enabled=False))
+        client = ViewsClient(UNUSED_HTTP_CLIENT, cache_config=CacheConfig(enabled=False))
         assert not hasattr(client.get, "cache_info")